@@ -1,8 +1,19 @@
 from django.apps import AppConfig
 from django.core import checks
+from django.core.signals import setting_changed
 
 from django_vite.core.asset_loader import DjangoViteAssetLoader
 
+# Settings, besides the DJANGO_VITE* ones, read by DjangoViteAssetLoader and the
+# URLs it caches.
+LOADER_DEPENDENT_SETTINGS = {
+    "INSTALLED_APPS",
+    "STATIC_ROOT",
+    "STATIC_URL",
+    "STATICFILES_STORAGE",
+    "STORAGES",
+}
+
 
 class DjangoViteAppConfig(AppConfig):
     name = "django_vite"
@@ -16,6 +27,19 @@ class DjangoViteAppConfig(AppConfig):
         # Check for potential errors with loading manifests in DjangoViteConfigs.
         checks.register(check_loader_instance, checks.Tags.staticfiles)
 
+        # Rebuild the Loader instance when its settings are changed, e.g. by
+        # override_settings() in tests.
+        setting_changed.connect(reset_loader_instance)
+
 
 def check_loader_instance(**kwargs):
     return DjangoViteAssetLoader.instance().check(**kwargs)
+
+
+def reset_loader_instance(setting: str, **kwargs) -> None:
+    """
+    Drop the Loader instance, along with its parsed manifests and cached URLs, when
+    a setting it depends on changes. It is rebuilt on next use.
+    """
+    if setting in LOADER_DEPENDENT_SETTINGS or setting.startswith("DJANGO_VITE"):
+        DjangoViteAssetLoader._instance = None
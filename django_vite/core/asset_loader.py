@@ -1,11 +1,25 @@
-import json
+import sys
+import threading
+from functools import cached_property, lru_cache, wraps
 from pathlib import Path
-from typing import Dict, List, Callable, NamedTuple, Optional, Union
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import urljoin
 import warnings
 
 from django.apps import apps
 from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
 from django.core.checks import Warning
 
 from django_vite.core.exceptions import (
@@ -13,10 +27,24 @@ from django_vite.core.exceptions import (
     DjangoViteAssetNotFoundError,
     DjangoViteConfigNotFoundError,
 )
-from django_vite.core.tag_generator import Tag, TagGenerator, attrs_to_str
+from django_vite.core.tag_generator import TagGenerator, attrs_to_str, join_tags
+
+# Use orjson to parse manifests if it is installed, it is faster on large manifests.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 DEFAULT_APP_NAME = "default"
 
+# Attributes of the <link> tags preloading JS modules.
+MODULEPRELOAD_ATTRS = {
+    "type": "text/javascript",
+    "crossorigin": "anonymous",
+    "rel": "modulepreload",
+    "as": "script",
+}
+
 
 class DjangoViteConfig(NamedTuple):
     """
@@ -50,19 +78,26 @@ class DjangoViteConfig(NamedTuple):
     # Default Vite server path to React RefreshRuntime for @vitejs/plugin-react.
     react_refresh_url: str = "@react-refresh"
 
+    # Resolve production asset URLs only once per process, and reuse them along with
+    # the tags built from them. Don't enable it if your staticfiles storage returns
+    # expiring URLs, like signed S3 URLs.
+    cache_static_urls: bool = False
+
 
 class ManifestEntry(NamedTuple):
     """
     Represent an entry for a file inside the "manifest.json".
+    Lists of paths are stored as tuples, so that entries are immutable and don't
+    share mutable default values.
     """
 
     file: str
     src: Optional[str] = None
     isEntry: Optional[bool] = False
     isDynamicEntry: Optional[bool] = False
-    css: Optional[List[str]] = []
-    imports: Optional[List[str]] = []
-    dynamicImports: Optional[List[str]] = []
+    css: Tuple[str, ...] = ()
+    imports: Tuple[str, ...] = ()
+    dynamicImports: Tuple[str, ...] = ()
 
 
 class ManifestClient:
@@ -84,17 +119,20 @@ class ManifestClient:
         self.manifest_path = self._clean_manifest_path()
         self.legacy_polyfills_motif = config.legacy_polyfills_motif
 
-        self._entries: Dict[str, ManifestEntry] = {}
+        self._entries: Mapping[str, ManifestEntry] = MappingProxyType({})
         self.legacy_polyfills_entry: Optional[ManifestEntry] = None
+        self._manifest_error: Optional[DjangoViteManifestError] = None
 
         # Don't crash if there is an error while parsing manifest.json.
         # Running DjangoViteAssetLoader.instance().checks() on startup will log any
         # errors.
         if not self.dev_mode:
             try:
-                self._entries, self.legacy_polyfills_entry = self._parse_manifest()
-            except DjangoViteManifestError:
-                pass
+                entries, self.legacy_polyfills_entry = self._parse_manifest()
+                # Entries are shared by all threads, make them read-only.
+                self._entries = MappingProxyType(entries)
+            except DjangoViteManifestError as error:
+                self._manifest_error = error
 
     def _clean_manifest_path(self) -> Path:
         """
@@ -118,23 +156,25 @@ class ManifestClient:
             return initial_manifest_path
 
     def check(self) -> List[Warning]:
-        """Check that manifest files are valid when dev_mode=False."""
-        try:
-            if not self.dev_mode:
-                self._parse_manifest()
+        """
+        Check that manifest files are valid when dev_mode=False.
+        Reports the error raised when the manifest was parsed at startup, instead of
+        reading the manifest file again.
+        """
+        if self._manifest_error is None:
             return []
-        except DjangoViteManifestError as exception:
-            return [
-                Warning(
-                    exception,
-                    id="django_vite.W001",
-                    hint=(
-                        f"Make sure you have generated a manifest file, "
-                        f'and that DJANGO_VITE["{self.app_name}"]["manifest_path"] '
-                        "points to the correct location."
-                    ),
-                )
-            ]
+
+        return [
+            Warning(
+                self._manifest_error,
+                id="django_vite.W001",
+                hint=(
+                    f"Make sure you have generated a manifest file, "
+                    f'and that DJANGO_VITE["{self.app_name}"]["manifest_path"] '
+                    "points to the correct location."
+                ),
+            )
+        ]
 
     class ParsedManifestOutput(NamedTuple):
         # all entries within the manifest
@@ -142,6 +182,9 @@ class ManifestClient:
         # The manifest entry for legacy polyfills, if it exists within the manifest
         legacy_polyfills_entry: Optional[ManifestEntry] = None
 
+    # ManifestEntry fields listing paths of other files.
+    PATH_LIST_FIELDS = ("css", "imports", "dynamicImports")
+
     def _parse_manifest(self) -> ParsedManifestOutput:
         """
         Read and parse the Vite manifest file.
@@ -163,9 +206,8 @@ class ManifestClient:
         legacy_polyfills_entry: Optional[ManifestEntry] = None
 
         try:
-            with open(self.manifest_path, "r") as manifest_file:
-                manifest_content = manifest_file.read()
-                manifest_json = json.loads(manifest_content)
+            with open(self.manifest_path, "rb") as manifest_file:
+                manifest_json = json_loads(manifest_file.read())
 
                 for path, manifest_entry_data in manifest_json.items():
                     filtered_manifest_entry_data = {
@@ -173,7 +215,17 @@ class ManifestClient:
                         for key, value in manifest_entry_data.items()
                         if key in ManifestEntry._fields
                     }
+                    # Store lists of paths as tuples of interned strings. The same
+                    # paths are repeated across many entries, and used as keys for
+                    # every lookup. Interning them shares a single string per path,
+                    # and lets dict lookups match on identity.
+                    for key in self.PATH_LIST_FIELDS:
+                        if key in filtered_manifest_entry_data:
+                            filtered_manifest_entry_data[key] = tuple(
+                                map(sys.intern, filtered_manifest_entry_data[key])
+                            )
                     manifest_entry = ManifestEntry(**filtered_manifest_entry_data)
+                    path = sys.intern(path)
                     entries[path] = manifest_entry
                     if self.legacy_polyfills_motif in path:
                         legacy_polyfills_entry = manifest_entry
@@ -206,6 +258,27 @@ class ManifestClient:
         return self._entries[path]
 
 
+def cache_production_output(method: Callable[..., str]) -> Callable[..., str]:
+    """
+    Memoize the output of a DjangoViteAppClient method when dev_mode=False and
+    cache_static_urls=True.
+    In production, generated tags and URLs then only depend on the manifest parsed
+    at startup, so they can be reused across renders. The cache lives on the client,
+    so it is dropped along with the DjangoViteAssetLoader instance.
+    """
+
+    @wraps(method)
+    def wrapper(self: "DjangoViteAppClient", *args, **kwargs) -> str:
+        # Calls with extra attributes aren't memoized, since they often differ on
+        # every request, like a CSP nonce.
+        if self.dev_mode or not self.cache_static_urls or kwargs:
+            return method(self, *args, **kwargs)
+
+        return self._cached_output(method.__name__, args)
+
+    return wrapper
+
+
 class DjangoViteAppClient:
     """
     An interface for generating assets and urls from one vite app.
@@ -225,9 +298,40 @@ class DjangoViteAppClient:
         self.static_url_prefix = config.static_url_prefix
         self.ws_client_url = config.ws_client_url
         self.react_refresh_url = config.react_refresh_url
+        self.cache_static_urls = config.cache_static_urls
 
         self.manifest = ManifestClient(config, app_name)
 
+        self._cached_output = lru_cache(maxsize=1024)(self._generate_output)
+        self._resolved_assets: Dict[str, DjangoViteAppClient.ResolvedAsset] = {}
+        self._production_server_urls: Dict[str, str] = {}
+
+    def _generate_output(self, method_name: str, args: Tuple) -> str:
+        """
+        Calls the undecorated version of a @cache_production_output method.
+        """
+        method = getattr(self, method_name).__wrapped__
+        return method(self, *args)
+
+    @cached_property
+    def _dev_server_static_url(self) -> str:
+        """
+        Base URL of the static files served by the Vite development server.
+        Computed once, so that generating an URL only needs a single urljoin.
+
+        Returns:
+            str -- Full URL to STATIC_URL / static_url_prefix on the dev server.
+        """
+        static_url_base = urljoin(settings.STATIC_URL, self.static_url_prefix)
+        if not static_url_base.endswith("/"):
+            static_url_base += "/"
+
+        return urljoin(
+            f"{self.dev_server_protocol}://"
+            f"{self.dev_server_host}:{self.dev_server_port}",
+            static_url_base,
+        )
+
     def _get_dev_server_url(
         self,
         path: str,
@@ -241,19 +345,33 @@ class DjangoViteAppClient:
         Returns:
             str -- Full URL to the asset.
         """
-        static_url_base = urljoin(settings.STATIC_URL, self.static_url_prefix)
-        if not static_url_base.endswith("/"):
-            static_url_base += "/"
+        return urljoin(self._dev_server_static_url, path)
 
-        return urljoin(
-            f"{self.dev_server_protocol}://"
-            f"{self.dev_server_host}:{self.dev_server_port}",
-            urljoin(static_url_base, path),
-        )
+    @cached_property
+    def _production_static_prefix(self) -> str:
+        """
+        The static_url_prefix, with a trailing slash so that paths can be joined
+        onto it. Empty if no prefix was configured.
+        """
+        prefix = self.static_url_prefix
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+        return prefix
+
+    @cached_property
+    def _staticfiles_enabled(self) -> bool:
+        """
+        Whether URLs should be resolved through staticfiles storage.
+        Installed apps can't change once the app registry is ready, so the
+        registry is only checked once.
+        """
+        return apps.is_installed("django.contrib.staticfiles")
 
     def _get_production_server_url(self, path: str) -> str:
         """
         Generates an URL to an asset served during production.
+        With cache_static_urls=True, the URL of a path is only resolved through
+        staticfiles storage once.
 
         Keyword Arguments:
             path {str} -- Path to the asset.
@@ -262,19 +380,27 @@ class DjangoViteAppClient:
             str -- Full URL to the asset.
         """
 
+        if not self.cache_static_urls:
+            return self._resolve_production_server_url(path)
+
+        if path not in self._production_server_urls:
+            self._production_server_urls[path] = self._resolve_production_server_url(
+                path
+            )
+
+        return self._production_server_urls[path]
+
+    def _resolve_production_server_url(self, path: str) -> str:
         production_server_url = path
-        if prefix := self.static_url_prefix:
-            if not prefix.endswith("/"):
-                prefix += "/"
+        if prefix := self._production_static_prefix:
             production_server_url = urljoin(prefix, path)
 
-        if apps.is_installed("django.contrib.staticfiles"):
-            from django.contrib.staticfiles.storage import staticfiles_storage
-
+        if self._staticfiles_enabled:
             return staticfiles_storage.url(production_server_url)
 
         return production_server_url
 
+    @cache_production_output
     def generate_vite_asset(
         self,
         path: str,
@@ -309,43 +435,23 @@ class DjangoViteAppClient:
                 attrs={"type": "module", **kwargs},
             )
 
-        tags: List[Tag] = []
-        manifest_entry = self.manifest.get(path)
+        resolved_asset = self._resolve_asset(path)
         scripts_attrs = {"type": "module", "crossorigin": "", **kwargs}
 
-        # Add dependent CSS
-        tags.extend(self._load_css_files_of_asset(path))
-
         # Add the script by itself
-        url = self._get_production_server_url(manifest_entry.file)
-        tags.append(
-            TagGenerator.script(
-                url,
-                attrs=scripts_attrs,
-            )
+        script_tag = TagGenerator.script(
+            resolved_asset.file_url,
+            attrs=scripts_attrs,
         )
 
-        # Preload imports
-        preload_attrs = {
-            "type": "text/javascript",
-            "crossorigin": "anonymous",
-            "rel": "modulepreload",
-            "as": "script",
-        }
-
-        for dep in manifest_entry.imports:
-            dep_manifest_entry = self.manifest.get(dep)
-            dep_file = dep_manifest_entry.file
-            url = self._get_production_server_url(dep_file)
-            tags.append(
-                TagGenerator.preload(
-                    url,
-                    attrs=preload_attrs,
-                )
-            )
-
-        return "\n".join(tags)
+        # Surround it with the dependent CSS and the preloaded imports
+        return join_tags(
+            resolved_asset.stylesheet_tags,
+            script_tag,
+            resolved_asset.import_preload_tags,
+        )
 
+    @cache_production_output
     def preload_vite_asset(
         self,
         path: str,
@@ -370,104 +476,125 @@ class DjangoViteAppClient:
         if self.dev_mode:
             return ""
 
-        tags: List[Tag] = []
-        manifest_entry = self.manifest.get(path)
+        resolved_asset = self._resolve_asset(path)
 
         # Add the script by itself
-        script_attrs = {
-            "type": "text/javascript",
-            "crossorigin": "anonymous",
-            "rel": "modulepreload",
-            "as": "script",
-        }
-
-        manifest_file = manifest_entry.file
-        url = self._get_production_server_url(manifest_file)
-        tags.append(
-            TagGenerator.preload(
-                url,
-                attrs=script_attrs,
-            )
+        script_tag = TagGenerator.preload(
+            resolved_asset.file_url,
+            attrs=MODULEPRELOAD_ATTRS,
         )
 
-        # Add dependent CSS
-        tags.extend(self._preload_css_files_of_asset(path))
-
-        # Preload imports
-        for dep in manifest_entry.imports:
-            dep_manifest_entry = self.manifest.get(dep)
-            dep_file = dep_manifest_entry.file
-            url = self._get_production_server_url(dep_file)
-            tags.append(
-                TagGenerator.preload(
-                    url,
-                    attrs=script_attrs,
-                )
-            )
+        # Followed by the dependent CSS and the preloaded imports
+        return join_tags(
+            script_tag,
+            resolved_asset.stylesheet_preload_tags,
+            resolved_asset.import_preload_tags,
+        )
 
-        return "\n".join(tags)
+    class ResolvedAsset(NamedTuple):
+        # URL of the asset's own file
+        file_url: str
+        # <link> tags for all CSS files needed by the asset and its imports
+        stylesheet_tags: str
+        # <link rel="preload"> tags for the same CSS files
+        stylesheet_preload_tags: str
+        # <link rel="modulepreload"> tags for the JS files directly imported
+        import_preload_tags: str
+
+    def _resolve_asset(self, path: str) -> ResolvedAsset:
+        """
+        Resolves the production URLs of an asset and of its dependencies, and
+        renders the tags of those dependencies, which don't depend on any template
+        tag arguments.
+        With cache_static_urls=True, the result is kept for the lifetime of the
+        client. URLs are resolved on first use rather than while parsing the
+        manifest, since staticfiles storage may not be usable yet when the manifest
+        is parsed in AppConfig.ready().
 
-    def _preload_css_files_of_asset(
-        self,
-        path: str,
-    ) -> List[Tag]:
-        return self._generate_css_files_of_asset(
-            path,
-            tag_generator=TagGenerator.stylesheet_preload,
-        ).tags
+        Arguments:
+            path {str} -- Path to an asset in the 'manifest.json'.
 
-    def _load_css_files_of_asset(
-        self,
-        path: str,
-    ) -> List[Tag]:
-        return self._generate_css_files_of_asset(
-            path,
-            tag_generator=TagGenerator.stylesheet,
-        ).tags
-
-    class GeneratedCssFilesOutput(NamedTuple):
-        # list of generated CSS tags
-        tags: List[Tag]
-        # list of already processed CSS tags
-        already_processed: List[str]
-
-    def _generate_css_files_of_asset(
+        Returns:
+            ResolvedAsset -- URL of the asset and tags of its CSS and imports.
+
+        Raises:
+            DjangoViteAssetNotFoundError: if cannot find the asset path or one of
+                its imports in the manifest.
+        """
+        if path in self._resolved_assets:
+            return self._resolved_assets[path]
+
+        manifest_entry = self.manifest.get(path)
+        css_urls = self._generate_css_urls_of_asset(path)
+        import_urls = [
+            self._get_production_server_url(self.manifest.get(dep).file)
+            for dep in manifest_entry.imports
+        ]
+        resolved_asset = self.ResolvedAsset(
+            file_url=self._get_production_server_url(manifest_entry.file),
+            stylesheet_tags="\n".join(
+                [TagGenerator.stylesheet(url) for url in css_urls]
+            ),
+            stylesheet_preload_tags="\n".join(
+                [TagGenerator.stylesheet_preload(url) for url in css_urls]
+            ),
+            import_preload_tags="\n".join(
+                [
+                    TagGenerator.preload(url, attrs=MODULEPRELOAD_ATTRS)
+                    for url in import_urls
+                ]
+            ),
+        )
+
+        if self.cache_static_urls:
+            self._resolved_assets[path] = resolved_asset
+
+        return resolved_asset
+
+    def _generate_css_urls_of_asset(
         self,
         path: str,
-        already_processed: Optional[List[str]] = None,
-        tag_generator: Callable[[str], Tag] = TagGenerator.stylesheet,
-    ) -> GeneratedCssFilesOutput:
+    ) -> List[str]:
         """
-        Generates all CSS tags for dependencies of an asset.
+        Generates the URLs of all CSS dependencies of an asset.
+        Walks the imports depth-first, with an explicit stack rather than recursion,
+        and lists the CSS of each import before the CSS of the file importing it.
+        Each import is only walked once, which also protects against import cycles.
 
         Arguments:
             path {str} -- Path to an asset in the 'manifest.json'.
-            config_key {str} -- Key of the configuration to use.
-            already_processed {list} -- List of already processed CSS file.
 
         Returns:
-            tags -- List of CSS tags.
-            already_processed -- List of already processed css paths
+            List[str] -- URLs of the CSS files.
         """
-        if already_processed is None:
-            already_processed = []
-        tags: List[Tag] = []
+        urls: List[str] = []
+        already_processed: Set[str] = set()
+        visited_imports = {path}
         manifest_entry = self.manifest.get(path)
-
-        for import_path in manifest_entry.imports:
-            new_tags, _ = self._generate_css_files_of_asset(
-                import_path, already_processed, tag_generator
-            )
-            tags.extend(new_tags)
-
-        for css_path in manifest_entry.css:
-            if css_path not in already_processed:
-                url = self._get_production_server_url(css_path)
-                tags.append(tag_generator(url))
-                already_processed.append(css_path)
-
-        return self.GeneratedCssFilesOutput(tags, already_processed)
-
+        # Each item is an entry being walked, and an iterator over its imports
+        # that haven't been walked yet.
+        stack = [(manifest_entry, iter(manifest_entry.imports))]
+
+        while stack:
+            manifest_entry, pending_imports = stack[-1]
+
+            for import_path in pending_imports:
+                if import_path not in visited_imports:
+                    visited_imports.add(import_path)
+                    import_entry = self.manifest.get(import_path)
+                    stack.append((import_entry, iter(import_entry.imports)))
+                    break
+            else:
+                # All imports were walked, add the CSS of the entry itself.
+                stack.pop()
+                for css_path in manifest_entry.css:
+                    if css_path not in already_processed:
+                        urls.append(self._get_production_server_url(css_path))
+                        already_processed.add(css_path)
+
+        return urls
+
+    @cache_production_output
     def generate_vite_asset_url(self, path: str) -> str:
         """
         Generates only the URL of an asset managed by ViteJS.
@@ -487,6 +614,7 @@ class DjangoViteAppClient:
 
         return self._get_production_server_url(manifest_entry.file)
 
+    @cache_production_output
     def generate_vite_legacy_polyfills(
         self,
         **kwargs: Dict[str, str],
@@ -528,6 +656,7 @@ class DjangoViteAppClient:
             attrs=scripts_attrs,
         )
 
+    @cache_production_output
     def generate_vite_legacy_asset(
         self,
         path: str,
@@ -628,6 +757,7 @@ class DjangoViteAssetLoader:
     """
 
     _instance = None
+    _instance_lock = threading.Lock()
     _apps: Dict[str, DjangoViteAppClient]
 
     DJANGO_VITE = "DJANGO_VITE"
@@ -654,18 +784,27 @@ class DjangoViteAssetLoader:
         Singleton.
         Uses singleton to keep parsed manifests in memory after
         the first time they are loaded.
+        Building the instance is guarded by a lock, so that concurrent threads
+        never parse the manifests twice or see a partially configured instance.
 
         Returns:
             DjangoViteAssetLoader -- only instance of the class.
         """
 
         if cls._instance is None:
-            cls._instance = cls.__new__(cls)
-            cls._instance._apps = {}
+            with cls._instance_lock:
+                # Another thread may have built the instance while we were waiting
+                # for the lock.
+                if cls._instance is None:
+                    instance = cls.__new__(cls)
+                    instance._apps = {}
+
+                    instance._apply_django_vite_settings()
+                    instance._apply_legacy_django_vite_settings()
+                    instance._apply_default_fallback()
 
-            cls._apply_django_vite_settings()
-            cls._apply_legacy_django_vite_settings()
-            cls._apply_default_fallback()
+                    # Only publish the instance once it is fully configured.
+                    cls._instance = instance
 
         return cls._instance
 
@@ -677,14 +816,13 @@ class DjangoViteAssetLoader:
             errors.extend(manifest_warnings)
         return errors
 
-    @classmethod
-    def _apply_django_vite_settings(cls):
+    def _apply_django_vite_settings(self):
         """
         Takes DjangoViteConfigs from the DJANGO_VITE setting, and plugs them into
         DjangoViteAppClients.
         """
 
-        django_vite_settings = getattr(settings, cls.DJANGO_VITE, None)
+        django_vite_settings = getattr(settings, self.DJANGO_VITE, None)
 
         if not django_vite_settings:
             return
@@ -692,19 +830,18 @@ class DjangoViteAssetLoader:
         for app_name, config in django_vite_settings.items():
             if not isinstance(config, DjangoViteConfig):
                 config = DjangoViteConfig(**config)
-            cls._instance._apps[app_name] = DjangoViteAppClient(config, app_name)
+            self._apps[app_name] = DjangoViteAppClient(config, app_name)
 
-    @classmethod
-    def _apply_legacy_django_vite_settings(cls):
+    def _apply_legacy_django_vite_settings(self):
         """
         If the project hasn't yet migrated to the new way of configuring django-vite,
         then plug values from the legacy settings into an app named "default".
         """
 
-        applied_settings = dir(settings)
-        legacy_settings_keys = cls.LEGACY_DJANGO_VITE_SETTINGS.keys()
+        # Only look up the few known legacy settings, rather than enumerating every
+        # setting with dir().
         applied_legacy_settings = [
-            key for key in legacy_settings_keys if key in applied_settings
+            key for key in self.LEGACY_DJANGO_VITE_SETTINGS if hasattr(settings, key)
         ]
 
         if not applied_legacy_settings:
@@ -713,11 +850,11 @@ class DjangoViteAssetLoader:
         # If there are both new DJANGO_VITE settings as well as legacy settings, then
         # allow _apply_django_vite_settings to apply only the DJANGO_VITE configs and
         # ignore the legacy settings.
-        if cls.DJANGO_VITE in applied_settings:
+        if hasattr(settings, self.DJANGO_VITE):
             warnings.warn(
-                f"You're mixing the new {cls.DJANGO_VITE} setting with these "
+                f"You're mixing the new {self.DJANGO_VITE} setting with these "
                 f"legacy settings: [{', '.join(applied_legacy_settings)}]. Those legacy "
-                f"settings will be ignored since you have a {cls.DJANGO_VITE}"
+                f"settings will be ignored since you have a {self.DJANGO_VITE}"
                 " setting configured. Please remove those legacy django-vite settings.",
                 DeprecationWarning,
             )
@@ -727,29 +864,28 @@ class DjangoViteAssetLoader:
         warnings.warn(
             f"The settings [{', '.join(applied_legacy_settings)}] will be removed "
             "in future releases of django-vite. Please switch to defining your "
-            f'settings as {cls.DJANGO_VITE} = {{"default": {{...}},}}.',
+            f'settings as {self.DJANGO_VITE} = {{"default": {{...}},}}.',
             DeprecationWarning,
         )
 
         legacy_config = {}
         for legacy_setting in applied_legacy_settings:
-            new_config_name = cls.LEGACY_DJANGO_VITE_SETTINGS[legacy_setting]
+            new_config_name = self.LEGACY_DJANGO_VITE_SETTINGS[legacy_setting]
             if new_config_name:
                 legacy_config[new_config_name] = getattr(settings, legacy_setting)
         legacy_config = DjangoViteConfig(**legacy_config)
-        cls._instance._apps[DEFAULT_APP_NAME] = DjangoViteAppClient(legacy_config)
+        self._apps[DEFAULT_APP_NAME] = DjangoViteAppClient(legacy_config)
 
-    @classmethod
-    def _apply_default_fallback(cls):
+    def _apply_default_fallback(self):
         """
         If no settings at all were provided (and no DjangoViteAppClient were
         instantiated), we can create a "default" DjangoViteAppClient using the default
         values of DjangoViteConfig.
         """
 
-        if not cls._instance._apps:
+        if not self._apps:
             default_config = DjangoViteConfig()
-            cls._instance._apps[DEFAULT_APP_NAME] = DjangoViteAppClient(default_config)
+            self._apps[DEFAULT_APP_NAME] = DjangoViteAppClient(default_config)
 
     def _get_app_client(self, app: str) -> DjangoViteAppClient:
         """
@@ -8,10 +8,21 @@ def attrs_to_str(attrs: Dict[str, str]):
     Convert dictionary of attributes into a string that can be injected into a <script/>
     tag.
     """
+    # str.join builds a list from a generator anyway, so passing it a list
+    # comprehension is faster than a generator expression. Attributes can't be
+    # unrolled into a fixed f-string either, since template tag kwargs are merged
+    # into them.
     attrs_str = " ".join([f'{key}="{value}"' for key, value in attrs.items()])
     return attrs_str
 
 
+def join_tags(*tags: Tag) -> Tag:
+    """
+    Join tags, or newline separated blocks of tags, skipping empty ones.
+    """
+    return "\n".join([tag for tag in tags if tag])
+
+
 class TagGenerator:
     @staticmethod
     def script(src: str, attrs: Dict[str, str]) -> Tag:
@@ -39,5 +39,5 @@ setup(
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
     ],
-    extras_require={"dev": ["black"]},
+    extras_require={"dev": ["black"], "orjson": ["orjson"]},
 )
@@ -133,3 +133,20 @@ def dev_mode_all(request, patch_settings):
     settings that we support.
     """
     return patch_settings(request.param)
+
+
+@pytest.fixture()
+def cache_static_urls(patch_settings):
+    """
+    Run a test with dev_mode=False and cache_static_urls=True.
+    """
+    return patch_settings(
+        {
+            "DJANGO_VITE": {
+                "default": {
+                    "dev_mode": False,
+                    "cache_static_urls": True,
+                }
+            }
+        }
+    )
@@ -284,3 +284,40 @@ def test_vite_asset_external_app_production(external_vue_app):
     soup = BeautifulSoup(html, "html.parser")
     script_tag = soup.find("script")
     assert script_tag["src"] == "custom/prefix/assets/entry-5c085aac.js"
+
+
+@pytest.mark.parametrize("legacy_settings", [True, False])
+def test_vite_asset_circular_imports(patch_settings, settings, legacy_settings):
+    manifest_path = settings.STATIC_ROOT / "circular-imports-manifest.json"
+    if legacy_settings:
+        patch_settings(
+            {
+                "DJANGO_VITE_DEV_MODE": False,
+                "DJANGO_VITE_MANIFEST_PATH": manifest_path,
+            }
+        )
+    else:
+        patch_settings(
+            {
+                "DJANGO_VITE": {
+                    "default": {
+                        "dev_mode": False,
+                        "manifest_path": manifest_path,
+                    }
+                }
+            }
+        )
+    template = Template(
+        """
+        {% load django_vite %}
+        {% vite_asset "src/entry.ts" %}
+    """
+    )
+    html = template.render(Context({}))
+    soup = BeautifulSoup(html, "html.parser")
+    stylesheets = soup.find_all("link", rel="stylesheet")
+    assert [stylesheet["href"] for stylesheet in stylesheets] == [
+        "assets/b-8a3d2e5f.css",
+        "assets/a-1f6b9c3e.css",
+        "assets/entry-3b1f0c2a.css",
+    ]
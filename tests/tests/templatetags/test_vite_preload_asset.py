@@ -5,7 +5,7 @@ from django_vite.core.exceptions import DjangoViteAssetNotFoundError
 
 
 @pytest.mark.usefixtures("dev_mode_true")
-def test_preload_vite_asset_returns_nothing_with_dev_mode_on():
+def test_preload_vite_asset_returns_nothing_with_dev_mode_on(settings, tmp_path):
     template = Template(
         """
         {% load django_vite %}
@@ -16,6 +16,19 @@ def test_preload_vite_asset_returns_nothing_with_dev_mode_on():
     soup = BeautifulSoup(html, "html.parser")
     assert str(soup).strip() == ""
 
+    # The manifest isn't read at all, so a missing manifest and an unknown asset
+    # don't raise either.
+    settings.STATIC_ROOT = tmp_path
+    template = Template(
+        """
+        {% load django_vite %}
+        {% vite_preload_asset "src/fake.ts" %}
+    """
+    )
+    html = template.render(Context({}))
+    soup = BeautifulSoup(html, "html.parser")
+    assert str(soup).strip() == ""
+
 
 @pytest.mark.usefixtures("dev_mode_false")
 def test_preload_vite_asset_returns_production_tags():
@@ -1,5 +1,9 @@
+import json
+from collections import Counter
+
 import pytest
 
+from django_vite.core import asset_loader
 from django_vite.core.asset_loader import DjangoViteConfig, ManifestClient
 from django_vite.templatetags.django_vite import DjangoViteAssetLoader
 from django_vite.apps import check_loader_instance
@@ -148,3 +152,158 @@ def test_parse_manifest_during_dev_mode(dev_mode_true):
 def test_load_dynamic_import_manifest(patch_settings):
     warnings = check_loader_instance()
     assert len(warnings) == 0
+
+
+def test_production_output_is_reused(cache_static_urls):
+    default_app = DjangoViteAssetLoader.instance()._apps["default"]
+    asset = default_app.generate_vite_asset("src/entry.ts")
+    preload = default_app.preload_vite_asset("src/entry.ts")
+    assert asset != preload
+    assert default_app.generate_vite_asset("src/entry.ts") == asset
+    assert default_app.preload_vite_asset("src/entry.ts") == preload
+
+
+def test_production_output_renders_each_nonce(cache_static_urls):
+    default_app = DjangoViteAssetLoader.instance()._apps["default"]
+    first_output = default_app.generate_vite_asset("src/entry.ts", nonce="a")
+    second_output = default_app.generate_vite_asset("src/entry.ts", nonce="b")
+    assert 'nonce="a"' in first_output
+    assert 'nonce="b"' in second_output
+    assert 'nonce="a"' not in second_output
+
+
+def test_parse_manifest_with_stdlib_json(patch_settings, monkeypatch):
+    calls = []
+
+    def stdlib_json_loads(content):
+        calls.append(content)
+        return json.loads(content)
+
+    monkeypatch.setattr(asset_loader, "json_loads", stdlib_json_loads)
+    patch_settings({"DJANGO_VITE": {"default": {"dev_mode": False}}})
+    loader = DjangoViteAssetLoader.instance()
+    assert loader.generate_vite_asset_url("src/entry.ts").endswith(
+        "assets/entry-29e38a60.js"
+    )
+    assert len(calls) == 1
+
+
+def test_dev_server_urls_follow_setting_changes(dev_mode_true, settings):
+    loader = DjangoViteAssetLoader.instance()
+    assert loader.generate_vite_asset_url("src/entry.ts") == (
+        "http://localhost:5173/static/src/entry.ts"
+    )
+
+    settings.STATIC_URL = "/cdn/"
+    loader = DjangoViteAssetLoader.instance()
+    assert loader.generate_vite_asset_url("src/entry.ts") == (
+        "http://localhost:5173/cdn/src/entry.ts"
+    )
+
+
+class CountingStorage:
+    """
+    Stand-in for staticfiles_storage, counting the URLs resolved for each path.
+    """
+
+    def __init__(self):
+        self.calls = Counter()
+
+    def url(self, path):
+        self.calls[path] += 1
+        return f"/static/{path}"
+
+
+@pytest.fixture()
+def counting_storage(patch_settings, monkeypatch):
+    patch_settings({"INSTALLED_APPS": ["django_vite", "django.contrib.staticfiles"]})
+    storage = CountingStorage()
+    monkeypatch.setattr(asset_loader, "staticfiles_storage", storage)
+    return storage
+
+
+def test_static_urls_are_resolved_once_per_path(counting_storage, cache_static_urls):
+    default_app = DjangoViteAssetLoader.instance()._apps["default"]
+    default_app.generate_vite_asset("src/entry.ts")
+    default_app.preload_vite_asset("src/entry.ts")
+    default_app.generate_vite_asset_url("src/entry.ts")
+    assert counting_storage.calls["assets/entry-29e38a60.js"] == 1
+    assert set(counting_storage.calls.values()) == {1}
+
+
+def test_static_urls_are_not_cached_by_default(counting_storage, dev_mode_false):
+    default_app = DjangoViteAssetLoader.instance()._apps["default"]
+    default_app.generate_vite_asset("src/entry.ts")
+    default_app.generate_vite_asset("src/entry.ts")
+    assert set(counting_storage.calls.values()) == {2}
+
+
+def test_cached_static_urls_follow_setting_changes(patch_settings, settings):
+    patch_settings(
+        {
+            "INSTALLED_APPS": ["django_vite", "django.contrib.staticfiles"],
+            "DJANGO_VITE": {
+                "default": {
+                    "dev_mode": False,
+                    "cache_static_urls": True,
+                }
+            },
+        }
+    )
+    loader = DjangoViteAssetLoader.instance()
+    assert loader.generate_vite_asset_url("src/entry.ts") == (
+        "/static/assets/entry-29e38a60.js"
+    )
+
+    settings.STATIC_URL = "/cdn/"
+    loader = DjangoViteAssetLoader.instance()
+    assert loader.generate_vite_asset_url("src/entry.ts") == (
+        "/cdn/assets/entry-29e38a60.js"
+    )
+
+
+def test_resolved_asset_is_shared_between_tags(cache_static_urls):
+    default_app = DjangoViteAssetLoader.instance()._apps["default"]
+    default_app.generate_vite_asset("src/entry.ts")
+    resolved_asset = default_app._resolved_assets["src/entry.ts"]
+    default_app.preload_vite_asset("src/entry.ts")
+    assert default_app._resolved_assets["src/entry.ts"] is resolved_asset
+
+
+def test_parse_manifest_interns_paths(dev_mode_false):
+    manifest_client = DjangoViteAssetLoader.instance()._apps["default"].manifest
+    imported_path = manifest_client.get("src/entry.ts").imports[0]
+    assert any(path is imported_path for path in manifest_client._entries)
+
+
+def test_instance_is_not_rebuilt_after_waiting_for_lock(monkeypatch):
+    loader = DjangoViteAssetLoader.instance()
+
+    class PublishingLock:
+        """
+        Simulates another thread publishing the instance while this one was
+        waiting for the lock.
+        """
+
+        def __enter__(self):
+            DjangoViteAssetLoader._instance = loader
+
+        def __exit__(self, *args):
+            pass
+
+    monkeypatch.setattr(DjangoViteAssetLoader, "_instance", None)
+    monkeypatch.setattr(DjangoViteAssetLoader, "_instance_lock", PublishingLock())
+    assert DjangoViteAssetLoader.instance() is loader
+
+
+def test_manifest_entries_are_read_only(dev_mode_false):
+    manifest_client = DjangoViteAssetLoader.instance()._apps["default"].manifest
+    with pytest.raises(TypeError):
+        manifest_client._entries["src/fake.ts"] = manifest_client.get("src/entry.ts")
+
+
+def test_production_output_cache_distinguishes_value_types(cache_static_urls):
+    default_app = DjangoViteAssetLoader.instance()._apps["default"]
+    assert 'defer="1"' in default_app.generate_vite_asset("src/entry.ts", defer=1)
+    assert 'defer="True"' in default_app.generate_vite_asset("src/entry.ts", defer=True)
+    assert 'defer="1.0"' in default_app.generate_vite_asset("src/entry.ts", defer=1.0)